@@ -1,31 +1,104 @@
-import requests
+import urllib3
 import random
+import heapq
+import itertools
 import html
 import json
+import os
 import time
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
 import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+@lru_cache(maxsize=None)
+def _answer_orders(count: int) -> Tuple[Tuple[Tuple[int, ...], int], ...]:
+    """Every ordering of count answers, paired with where the last (correct) one lands"""
+    return tuple(
+        (order, order.index(count - 1))
+        for order in itertools.permutations(range(count))
+    )
+
+
 class APIHandler:
     BASE_URL = "https://opentdb.com/api.php"
     CATEGORIES_URL = "https://opentdb.com/api_category.php"
+    FIELD_SEPARATOR = "\x1f"
 
     def __init__(self):
-        self.session = requests.Session()
+        self.session = urllib3.PoolManager(
+            num_pools=2,
+            maxsize=4,
+            headers={'Accept-Encoding': 'gzip', 'Connection': 'keep-alive'},
+            retries=urllib3.Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+            timeout=10
+        )
+        self._categories_cache: Optional[Dict[int, str]] = None
+
+        # Warm the categories cache so the config screen doesn't wait on it
+        self._warm_error: Optional[Exception] = None
+        self._warm_thread: Optional[threading.Thread] = threading.Thread(
+            target=self._warm_categories, daemon=True
+        )
+        self._warm_thread.start()
 
     def get_categories(self) -> Dict[int, str]:
+        if self._warm_thread is not None:
+            self._warm_thread.join()
+            self._warm_thread = None
+            # Report a failed warm fetch instead of retrying straight away
+            if self._categories_cache is None:
+                print(f"Error fetching categories: {self._warm_error}")
+                return {}
+
+        if self._categories_cache is not None:
+            return self._categories_cache
+
         try:
-            response = self.session.get(self.CATEGORIES_URL, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            return {cat['id']: cat['name'] for cat in data['trivia_categories']}
-        except requests.RequestException as e:
+            return self._fetch_categories()
+        except (urllib3.exceptions.HTTPError, ValueError, KeyError) as e:
             print(f"Error fetching categories: {e}")
             return {}
 
+    def _warm_categories(self):
+        try:
+            self._fetch_categories()
+        except Exception as e:
+            self._warm_error = e
+
+    def _get(self, url: str, fields: Optional[Dict] = None) -> urllib3.HTTPResponse:
+        response = self.session.request('GET', url, fields=fields)
+        if response.status >= 400:
+            raise urllib3.exceptions.HTTPError(f"{response.status} error for url: {url}")
+        return response
+
+    def _fetch_categories(self) -> Dict[int, str]:
+        response = self._get(self.CATEGORIES_URL)
+        data = _json_loads(response.data)
+        categories = {cat['id']: cat['name'] for cat in data['trivia_categories']}
+        self._categories_cache = categories
+        return categories
+
     def fetch_questions(self, amount: int = 10, category: Optional[int] = None, 
                         difficulty: Optional[str] = None) -> List[Dict]:
         params = {
@@ -39,33 +112,50 @@ class APIHandler:
             params['difficulty'] = difficulty
 
         try:
-            response = self.session.get(self.BASE_URL, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            response = self._get(self.BASE_URL, fields=params)
+            data = _json_loads(response.data)
 
             if data['response_code'] == 0:
                 return self._parse_questions(data['results'])
             else:
                 raise Exception(f"API Error: Response code {data['response_code']}")
 
-        except requests.RequestException as e:
+        except urllib3.exceptions.HTTPError as e:
             raise Exception(f"Network error: {e}")
+        except (ValueError, KeyError) as e:
+            raise Exception(f"API Error: Invalid response ({e})")
 
     def _parse_questions(self, raw_questions: List[Dict]) -> List[Dict]:
+        # Unescape every field in one html.unescape call by joining on a
+        # control character that never appears in question text
+        fields = []
+        for q in raw_questions:
+            fields.extend((q['question'], q['correct_answer'], q['category']))
+            fields.extend(q['incorrect_answers'])
+
+        parts = html.unescape(self.FIELD_SEPARATOR.join(fields)).split(self.FIELD_SEPARATOR)
+        if len(parts) != len(fields):
+            parts = [html.unescape(field) for field in fields]
+
         questions = []
+        pos = 0
         for q in raw_questions:
+            num_incorrect = len(q['incorrect_answers'])
             parsed_q = {
-                'question': html.unescape(q['question']),
-                'correct_answer': html.unescape(q['correct_answer']),
-                'incorrect_answers': [html.unescape(ans) for ans in q['incorrect_answers']],
-                'category': html.unescape(q['category']),
+                'question': parts[pos],
+                'correct_answer': parts[pos + 1],
+                'incorrect_answers': parts[pos + 3:pos + 3 + num_incorrect],
+                'category': parts[pos + 2],
                 'difficulty': q['difficulty']
             }
             questions.append(parsed_q)
+            pos += 3 + num_incorrect
         return questions
 
 
 class QuizEngine:
+    # _answer_orders holds count! entries, so only use it for small counts
+    ANSWER_ORDER_TABLE_LIMIT = 4
 
     def __init__(self):
         self.questions = []
@@ -74,37 +164,44 @@ class QuizEngine:
         self.start_time = None
         self.question_times = []
         self.user_answers = []
+        self._time_sum = 0.0
+        self._final: Optional[Dict] = None
 
     def load_questions(self, questions: List[Dict]):
 
+        # Shuffle answers once up front so displaying a question is a lookup
+        for q in questions:
+            answers = q['incorrect_answers'] + [q['correct_answer']]
+            count = len(answers)
+            if count <= self.ANSWER_ORDER_TABLE_LIMIT:
+                order, correct_pos = random.choice(_answer_orders(count))
+            else:
+                order = random.sample(range(count), count)
+                correct_pos = order.index(count - 1)
+            q['shuffled_answers'] = [answers[k] for k in order]
+            q['correct_index'] = correct_pos
+
         self.questions = questions
         self.current_question = 0
         self.score = 0
         self.start_time = time.time()
         self.question_times = []
         self.user_answers = []
+        self._time_sum = 0.0
+        self._final = None
 
     def get_current_question(self) -> Optional[Dict]:
         if self.current_question >= len(self.questions):
             return None
 
-        question = self.questions[self.current_question].copy()
-
-        # Shuffle answers
-        all_answers = question['incorrect_answers'] + [question['correct_answer']]
-        random.shuffle(all_answers)
-
-        question['shuffled_answers'] = all_answers
-        question['correct_index'] = all_answers.index(question['correct_answer'])
-
-        return question
+        return self.questions[self.current_question]
 
     def submit_answer(self, answer_index: int, time_taken: float = 0) -> bool:
 
         if self.current_question >= len(self.questions):
             return False
 
-        question = self.get_current_question()
+        question = self.questions[self.current_question]
         is_correct = answer_index == question['correct_index']
 
         if is_correct:
@@ -120,6 +217,7 @@ class QuizEngine:
         })
 
         self.question_times.append(time_taken)
+        self._time_sum += time_taken
         self.current_question += 1
 
         return is_correct
@@ -128,10 +226,13 @@ class QuizEngine:
         return self.current_question, len(self.questions)
 
     def get_final_results(self) -> Dict:
+        if self._final is not None:
+            return self._final
+
         total_time = time.time() - self.start_time if self.start_time else 0
-        avg_time = sum(self.question_times) / len(self.question_times) if self.question_times else 0
+        avg_time = self._time_sum / len(self.question_times) if self.question_times else 0
 
-        return {
+        results = {
             'score': self.score,
             'total_questions': len(self.questions),
             'percentage': (self.score / len(self.questions)) * 100 if self.questions else 0,
@@ -140,40 +241,65 @@ class QuizEngine:
             'user_answers': self.user_answers
         }
 
+        # Only a finished quiz has final results worth keeping
+        if self.current_question >= len(self.questions):
+            self._final = results
+        return results
+
 
 class Utilities:
+    SCORES_FILE = "quiz_scores.jsonl"
+    LEGACY_SCORES_FILE = "quiz_scores.json"
+    SCORES_BUFFER_SIZE = 65536
 
     @staticmethod
     def validate_number_input(prompt: str, min_val: int, max_val: int) -> int:
+        range_message = f"Please enter a number between {min_val} and {max_val}"
         while True:
-            try:
-                value = int(input(prompt))
-                if min_val <= value <= max_val:
-                    return value
-                else:
-                    print(f"Please enter a number between {min_val} and {max_val}")
-            except ValueError:
+            raw = input(prompt).strip()
+            if not raw.isdecimal():
                 print("Please enter a valid number")
+                continue
+            value = int(raw)
+            if min_val <= value <= max_val:
+                return value
+            print(range_message)
 
     @staticmethod
     def validate_choice_input(prompt: str, valid_choices: List[str]) -> str:
+        choices = frozenset(valid_choices)
+        message = f"Please enter one of: {', '.join(valid_choices)}"
         while True:
             choice = input(prompt).strip().lower()
-            if choice in valid_choices:
+            if choice in choices:
                 return choice
-            print(f"Please enter one of: {', '.join(valid_choices)}")
+            print(message)
 
     @staticmethod
-    def save_score(results: Dict, filename: str = "quiz_scores.json"):
+    def _migrate_legacy_scores(filename: str):
+        """Convert the old single-list scores file to one JSON object per line"""
+        if filename != Utilities.SCORES_FILE or os.path.exists(filename):
+            return
         try:
-            # Load existing scores
-            try:
-                with open(filename, 'r') as f:
-                    scores = json.load(f)
-            except FileNotFoundError:
-                scores = []
-
-            # Add new score
+            with open(Utilities.LEGACY_SCORES_FILE, 'rb', buffering=Utilities.SCORES_BUFFER_SIZE) as f:
+                scores = _json_loads(f.read())
+        except FileNotFoundError:
+            return
+
+        with open(filename, 'wb', buffering=Utilities.SCORES_BUFFER_SIZE) as f:
+            f.write(b''.join(_json_dumps(score) + b'\n' for score in scores))
+
+    @staticmethod
+    def load_scores(filename: str = SCORES_FILE) -> List[Dict]:
+        Utilities._migrate_legacy_scores(filename)
+        with open(filename, 'rb', buffering=Utilities.SCORES_BUFFER_SIZE) as f:
+            return [_json_loads(line) for line in f if line.strip()]
+
+    @staticmethod
+    def save_score(results: Dict, filename: str = SCORES_FILE):
+        try:
+            Utilities._migrate_legacy_scores(filename)
+
             score_entry = {
                 'date': datetime.now().isoformat(),
                 'score': results['score'],
@@ -181,11 +307,10 @@ class Utilities:
                 'percentage': results['percentage'],
                 'total_time': results['total_time']
             }
-            scores.append(score_entry)
 
-            # Save updated scores
-            with open(filename, 'w') as f:
-                json.dump(scores, f, indent=2)
+            # Append the new score as a single line
+            with open(filename, 'ab') as f:
+                f.write(_json_dumps(score_entry) + b'\n')
 
             print(f"Score saved to {filename}")
 
@@ -193,19 +318,18 @@ class Utilities:
             print(f"Error saving score: {e}")
 
     @staticmethod
-    def display_high_scores(filename: str = "quiz_scores.json", top_n: int = 5):
+    def display_high_scores(filename: str = SCORES_FILE, top_n: int = 5):
         try:
-            with open(filename, 'r') as f:
-                scores = json.load(f)
+            scores = Utilities.load_scores(filename)
 
             if not scores:
                 print("No scores found.")
                 return
 
-            sorted_scores = sorted(scores, key=lambda x: (x['percentage'], -x['total_time']), reverse=True)
+            top_scores = heapq.nlargest(top_n, scores, key=lambda x: (x['percentage'], -x['total_time']))
 
             print(f"\n=== TOP {top_n} SCORES ===")
-            for i, score in enumerate(sorted_scores[:top_n], 1):
+            for i, score in enumerate(top_scores, 1):
                 date = datetime.fromisoformat(score['date']).strftime('%Y-%m-%d %H:%M')
                 print(f"{i}. {score['percentage']:.1f}% ({score['score']}/{score['total_questions']}) - {date}")
 
@@ -215,12 +339,22 @@ class Utilities:
             print(f"Error loading scores: {e}")
 
 
+_API: Optional[APIHandler] = None
+
+
+def shared_api_handler() -> APIHandler:
+    """Return the APIHandler shared by every interface, creating it on first use"""
+    global _API
+    if _API is None:
+        _API = APIHandler()
+    return _API
+
+
 class CLIInterface:
 
     def __init__(self):
-        self.api_handler = APIHandler()
+        self.api_handler = shared_api_handler()
         self.quiz_engine = QuizEngine()
-        self.utils = Utilities()
 
     def run(self):
         """Main CLI game loop"""
@@ -238,7 +372,7 @@ class CLIInterface:
             if choice == '1':
                 self._start_quiz()
             elif choice == '2':
-                self.utils.display_high_scores()
+                Utilities.display_high_scores()
             elif choice == '3':
                 print("Thanks for playing! Goodbye! 👋")
                 break
@@ -249,7 +383,7 @@ class CLIInterface:
 
         print("\n⚙️ Quiz Configuration")
 
-        num_questions = self.utils.validate_number_input(
+        num_questions = Utilities.validate_number_input(
             "Number of questions (1-50): ", 1, 50
         )
 
@@ -260,26 +394,26 @@ class CLIInterface:
             for cat_id, cat_name in categories.items():
                 print(f"{cat_id}. {cat_name}")
 
-            category_choice = self.utils.validate_number_input(
+            category_choice = Utilities.validate_number_input(
                 "Choose category (0 for any): ", 0, max(categories.keys())
             )
             category = category_choice if category_choice != 0 else None
         else:
             category = None
 
-        difficulty_choice = self.utils.validate_choice_input(
+        difficulty_choice = Utilities.validate_choice_input(
             "Choose difficulty (easy/medium/hard/any): ",
             ['easy', 'medium', 'hard', 'any']
         )
         difficulty = difficulty_choice if difficulty_choice != 'any' else None
 
-        use_timer = self.utils.validate_choice_input(
+        use_timer = Utilities.validate_choice_input(
             "Use timer per question? (y/n): ", ['y', 'n']
         ) == 'y'
 
         time_limit = 30
         if use_timer:
-            time_limit = self.utils.validate_number_input(
+            time_limit = Utilities.validate_number_input(
                 "Time limit per question (10-60 seconds): ", 10, 60
             )
 
@@ -342,7 +476,7 @@ class CLIInterface:
                     except ValueError:
                         answer_index = -1
             else:
-                answer_index = self.utils.validate_number_input(
+                answer_index = Utilities.validate_number_input(
                     "Enter your choice (1-4): ", 1, 4
                 ) - 1
                 elapsed = time.time() - start_time
@@ -386,7 +520,7 @@ class CLIInterface:
         else:
             print("📚 Keep studying! You'll do better next time!")
 
-        show_details = self.utils.validate_choice_input(
+        show_details = Utilities.validate_choice_input(
             "\nShow detailed results? (y/n): ", ['y', 'n']
         ) == 'y'
 
@@ -402,12 +536,12 @@ class CLIInterface:
                 print(f"   Time taken: {answer['time_taken']:.1f}s")
                 print()
 
-        save_score = self.utils.validate_choice_input(
+        save_score = Utilities.validate_choice_input(
             "Save your score? (y/n): ", ['y', 'n']
         ) == 'y'
 
         if save_score:
-            self.utils.save_score(results)
+            Utilities.save_score(results)
 
 
 class GUIInterface:
@@ -419,14 +553,21 @@ class GUIInterface:
         self.root.geometry("800x600")
         self.root.configure(bg='#f0f0f0')
         
-        self.api_handler = APIHandler()
+        self.api_handler = shared_api_handler()
         self.quiz_engine = QuizEngine()
-        self.utils = Utilities()
         
         self.current_question_data = None
+        self.results = None
         self.question_start_time = None
+        self._name_to_id: Dict[str, int] = {}
         self.selected_answer = tk.IntVar()
         
+        self.q_progress_var = tk.StringVar()
+        self.q_category_var = tk.StringVar()
+        self.q_difficulty_var = tk.StringVar()
+        self.q_text_var = tk.StringVar()
+        self.q_score_var = tk.StringVar()
+        
         self.setup_gui()
     
     def setup_gui(self):
@@ -443,14 +584,32 @@ class GUIInterface:
         self.main_frame = tk.Frame(self.root, bg='#f0f0f0')
         self.main_frame.pack(fill='both', expand=True, padx=20, pady=20)
         
+        # Every screen is built once and swapped in and out with _switch
+        self.screens = {
+            'menu': self._build_menu(),
+            'config': self._build_config(),
+            'loading': self._build_loading(),
+            'quiz': self._build_quiz(),
+            'results': self._build_results(),
+            'scores': self._build_scores()
+        }
+        self._screen_layout = {'quiz': {'fill': 'both', 'expand': True}}
+        self._current = None
+        
         self.show_menu()
     
-    def show_menu(self):
-        """Show main menu"""
-        self.clear_frame()
-        
+    def _switch(self, name: str):
+        """Hide the active screen and show the named one"""
+        screen = self.screens[name]
+        if self._current is screen:
+            return
+        if self._current is not None:
+            self._current.pack_forget()
+        screen.pack(**self._screen_layout.get(name, {'expand': True}))
+        self._current = screen
+    
+    def _build_menu(self) -> tk.Frame:
         menu_frame = tk.Frame(self.main_frame, bg='#f0f0f0')
-        menu_frame.pack(expand=True)
         
         tk.Button(
             menu_frame,
@@ -484,13 +643,15 @@ class GUIInterface:
             pady=10,
             command=self.root.quit
         ).pack(pady=10)
-    
-    def show_quiz_config(self):
-        """Show quiz configuration"""
-        self.clear_frame()
         
+        return menu_frame
+    
+    def show_menu(self):
+        """Show main menu"""
+        self._switch('menu')
+    
+    def _build_config(self) -> tk.Frame:
         config_frame = tk.Frame(self.main_frame, bg='#f0f0f0')
-        config_frame.pack(expand=True)
         
         tk.Label(
             config_frame,
@@ -520,8 +681,6 @@ class GUIInterface:
         )
         self.category_combo.pack(pady=5)
         
-        threading.Thread(target=self.load_categories, daemon=True).start()
-        
         tk.Label(config_frame, text="Difficulty:", bg='#f0f0f0').pack(pady=(20, 5))
         self.difficulty_var = tk.StringVar(value="Any")
         difficulty_combo = ttk.Combobox(
@@ -564,11 +723,22 @@ class GUIInterface:
             pady=5,
             command=self.show_menu
         ).pack()
+        
+        return config_frame
+    
+    def show_quiz_config(self):
+        """Show quiz configuration"""
+        self._switch('config')
+        
+        # Categories only need loading once; retry if the last attempt failed
+        if not self._name_to_id:
+            threading.Thread(target=self.load_categories, daemon=True).start()
     
     def load_categories(self):
         """Load categories from API"""
         try:
             categories = self.api_handler.get_categories()
+            self._name_to_id = {name: cat_id for cat_id, name in categories.items()}
             category_list = ["Any Category"] + list(categories.values())
             self.category_combo['values'] = category_list
             self.category_combo.set("Any Category")
@@ -583,13 +753,7 @@ class GUIInterface:
             difficulty = self.difficulty_var.get().lower() if self.difficulty_var.get() != "Any" else None
             
             # Get category ID
-            category_id = None
-            if category_name != "Any Category":
-                categories = self.api_handler.get_categories()
-                for cat_id, cat_name in categories.items():
-                    if cat_name == category_name:
-                        category_id = cat_id
-                        break
+            category_id = self._name_to_id.get(category_name)
             
            
             self.show_loading()
@@ -625,12 +789,8 @@ class GUIInterface:
             self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to load questions: {e}"))
             self.root.after(0, self.show_quiz_config)
     
-    def show_loading(self):
-        """Show loading screen"""
-        self.clear_frame()
-        
+    def _build_loading(self) -> tk.Frame:
         loading_frame = tk.Frame(self.main_frame, bg='#f0f0f0')
-        loading_frame.pack(expand=True)
         
         tk.Label(
             loading_frame,
@@ -638,22 +798,15 @@ class GUIInterface:
             font=("Arial", 16),
             bg='#f0f0f0'
         ).pack(pady=50)
-    
-    def show_question(self):
-        """Show current question"""
-        self.current_question_data = self.quiz_engine.get_current_question()
-        
-        if not self.current_question_data:
-            self.show_results()
-            return
-        
-        self.clear_frame()
-        self.question_start_time = time.time()
         
+        return loading_frame
+    
+    def show_loading(self):
+        """Show loading screen"""
+        self._switch('loading')
+    
+    def _build_quiz(self) -> tk.Frame:
         question_frame = tk.Frame(self.main_frame, bg='#f0f0f0')
-        question_frame.pack(fill='both', expand=True)
-        
-        current, total = self.quiz_engine.get_progress()
         
         
         info_frame = tk.Frame(question_frame, bg='#f0f0f0')
@@ -661,53 +814,53 @@ class GUIInterface:
         
         tk.Label(
             info_frame,
-            text=f"Question {current + 1}/{total}",
+            textvariable=self.q_progress_var,
             font=("Arial", 12, "bold"),
             bg='#f0f0f0'
         ).pack()
         
         tk.Label(
             info_frame,
-            text=f"Category: {self.current_question_data['category']}",
+            textvariable=self.q_category_var,
             font=("Arial", 10),
             bg='#f0f0f0'
         ).pack()
         
         tk.Label(
             info_frame,
-            text=f"Difficulty: {self.current_question_data['difficulty'].title()}",
+            textvariable=self.q_difficulty_var,
             font=("Arial", 10),
             bg='#f0f0f0'
         ).pack()
         
         
-        question_label = tk.Label(
+        tk.Label(
             question_frame,
-            text=self.current_question_data['question'],
+            textvariable=self.q_text_var,
             font=("Arial", 14),
             bg='#f0f0f0',
             wraplength=600,
             justify='center'
-        )
-        question_label.pack(pady=20)
+        ).pack(pady=20)
         
-    
-        self.selected_answer.set(-1)
         
         answers_frame = tk.Frame(question_frame, bg='#f0f0f0')
         answers_frame.pack(pady=20)
         
-        for i, answer in enumerate(self.current_question_data['shuffled_answers']):
-            tk.Radiobutton(
+        # opentdb "multiple" questions always have four answers
+        self.answer_buttons = []
+        for i in range(4):
+            button = tk.Radiobutton(
                 answers_frame,
-                text=answer,
                 variable=self.selected_answer,
                 value=i,
                 font=("Arial", 12),
                 bg='#f0f0f0',
                 wraplength=500,
                 justify='left'
-            ).pack(anchor='w', pady=5)
+            )
+            button.pack(anchor='w', pady=5)
+            self.answer_buttons.append(button)
         
     
         tk.Button(
@@ -724,10 +877,44 @@ class GUIInterface:
         
         tk.Label(
             question_frame,
-            text=f"Current Score: {self.quiz_engine.score}/{current}",
+            textvariable=self.q_score_var,
             font=("Arial", 12),
             bg='#f0f0f0'
         ).pack()
+        
+        return question_frame
+    
+    def show_question(self):
+        """Show current question"""
+        self.current_question_data = self.quiz_engine.get_current_question()
+        
+        if not self.current_question_data:
+            self.show_results()
+            return
+        
+        self.question_start_time = time.time()
+        
+        current, total = self.quiz_engine.get_progress()
+        
+        self.q_progress_var.set(f"Question {current + 1}/{total}")
+        self.q_category_var.set(f"Category: {self.current_question_data['category']}")
+        self.q_difficulty_var.set(f"Difficulty: {self.current_question_data['difficulty'].title()}")
+        self.q_text_var.set(self.current_question_data['question'])
+        
+    
+        self.selected_answer.set(-1)
+        
+        answers = self.current_question_data['shuffled_answers']
+        for i, button in enumerate(self.answer_buttons):
+            button.pack_forget()
+            if i < len(answers):
+                button.config(text=answers[i])
+                button.pack(anchor='w', pady=5)
+        
+        
+        self.q_score_var.set(f"Current Score: {self.quiz_engine.score}/{current}")
+        
+        self._switch('quiz')
     
     def submit_answer(self):
         """Submit the selected answer"""
@@ -744,14 +931,8 @@ class GUIInterface:
         
         self.show_question()
     
-    def show_results(self):
-        """Show final results"""
-        results = self.quiz_engine.get_final_results()
-        
-        self.clear_frame()
-        
+    def _build_results(self) -> tk.Frame:
         results_frame = tk.Frame(self.main_frame, bg='#f0f0f0')
-        results_frame.pack(expand=True)
         
         tk.Label(
             results_frame,
@@ -760,42 +941,34 @@ class GUIInterface:
             bg='#f0f0f0'
         ).pack(pady=20)
         
-        tk.Label(
+        self.final_score_label = tk.Label(
             results_frame,
-            text=f"Final Score: {results['score']}/{results['total_questions']}",
             font=("Arial", 16),
             bg='#f0f0f0'
-        ).pack(pady=5)
+        )
+        self.final_score_label.pack(pady=5)
         
-        tk.Label(
+        self.percentage_label = tk.Label(
             results_frame,
-            text=f"Percentage: {results['percentage']:.1f}%",
             font=("Arial", 16),
             bg='#f0f0f0'
-        ).pack(pady=5)
+        )
+        self.percentage_label.pack(pady=5)
         
-        tk.Label(
+        self.total_time_label = tk.Label(
             results_frame,
-            text=f"Total Time: {results['total_time']:.1f} seconds",
             font=("Arial", 12),
             bg='#f0f0f0'
-        ).pack(pady=5)
-        
-    
-        if results['percentage'] >= 80:
-            message = "🌟 Excellent! You're a quiz master!"
-        elif results['percentage'] >= 60:
-            message = "👍 Good job! Keep it up!"
-        else:
-            message = "📚 Keep studying! You'll do better next time!"
+        )
+        self.total_time_label.pack(pady=5)
         
-        tk.Label(
+        self.message_label = tk.Label(
             results_frame,
-            text=message,
             font=("Arial", 14),
             bg='#f0f0f0',
             fg='#4CAF50'
-        ).pack(pady=20)
+        )
+        self.message_label.pack(pady=20)
         
         
         button_frame = tk.Frame(results_frame, bg='#f0f0f0')
@@ -809,7 +982,7 @@ class GUIInterface:
             fg='white',
             padx=15,
             pady=5,
-            command=lambda: self.utils.save_score(results)
+            command=lambda: Utilities.save_score(self.results)
         ).pack(side='left', padx=10)
 
         tk.Button(
@@ -833,18 +1006,32 @@ class GUIInterface:
             pady=5,
             command=self.show_menu
         ).pack(side='left', padx=10)
+        
+        return results_frame
     
-    def clear_frame(self):
-        """Clear all widgets from main frame"""
-        for widget in self.main_frame.winfo_children():
-            widget.destroy()
-
-    def show_high_scores(self):
-        """Show high scores screen"""
-        self.clear_frame()
+    def show_results(self):
+        """Show final results"""
+        results = self.quiz_engine.get_final_results()
+        self.results = results
+        
+        self.final_score_label.config(text=f"Final Score: {results['score']}/{results['total_questions']}")
+        self.percentage_label.config(text=f"Percentage: {results['percentage']:.1f}%")
+        self.total_time_label.config(text=f"Total Time: {results['total_time']:.1f} seconds")
+        
+    
+        if results['percentage'] >= 80:
+            message = "🌟 Excellent! You're a quiz master!"
+        elif results['percentage'] >= 60:
+            message = "👍 Good job! Keep it up!"
+        else:
+            message = "📚 Keep studying! You'll do better next time!"
+        
+        self.message_label.config(text=message)
         
+        self._switch('results')
+    
+    def _build_scores(self) -> tk.Frame:
         scores_frame = tk.Frame(self.main_frame, bg='#f0f0f0')
-        scores_frame.pack(expand=True)
         
         tk.Label(
             scores_frame,
@@ -853,42 +1040,24 @@ class GUIInterface:
             bg='#f0f0f0'
         ).pack(pady=20)
         
+        # Rows are re-labelled each visit; the frame keeps them above the button
+        scores_list_frame = tk.Frame(scores_frame, bg='#f0f0f0')
+        scores_list_frame.pack()
         
-        try:
-            with open("quiz_scores.json", 'r') as f:
-                scores = json.load(f)
-            
-            if not scores:
-                tk.Label(
-                    scores_frame,
-                    text="No scores yet!",
-                    font=("Arial", 14),
-                    bg='#f0f0f0'
-                ).pack(pady=20)
-            else:
-                sorted_scores = sorted(
-                    scores,
-                    key=lambda x: (x['percentage'], -x['total_time']),
-                    reverse=True
-                )
-                
-                for i, score in enumerate(sorted_scores[:5], 1):
-                    date = datetime.fromisoformat(score['date']).strftime('%Y-%m-%d %H:%M')
-                    score_text = f"{i}. {score['percentage']:.1f}% ({score['score']}/{score['total_questions']}) - {date}"
-                    tk.Label(
-                        scores_frame,
-                        text=score_text,
-                        font=("Arial", 12),
-                        bg='#f0f0f0'
-                    ).pack(pady=5)
+        self.scores_status_label = tk.Label(
+            scores_list_frame,
+            font=("Arial", 14),
+            bg='#f0f0f0'
+        )
         
-        except FileNotFoundError:
+        self.score_row_labels = [
             tk.Label(
-                scores_frame,
-                text="No scores file found",
-                font=("Arial", 14),
+                scores_list_frame,
+                font=("Arial", 12),
                 bg='#f0f0f0'
-            ).pack(pady=20)
+            )
+            for _ in range(5)
+        ]
         
         
         tk.Button(
@@ -901,6 +1070,40 @@ class GUIInterface:
             pady=5,
             command=self.show_menu
         ).pack(pady=20)
+        
+        return scores_frame
+    
+    def show_high_scores(self):
+        """Show high scores screen"""
+        self.scores_status_label.pack_forget()
+        for label in self.score_row_labels:
+            label.pack_forget()
+        
+        
+        try:
+            scores = Utilities.load_scores()
+            
+            if not scores:
+                self.scores_status_label.config(text="No scores yet!")
+                self.scores_status_label.pack(pady=20)
+            else:
+                top_scores = heapq.nlargest(
+                    len(self.score_row_labels),
+                    scores,
+                    key=lambda x: (x['percentage'], -x['total_time'])
+                )
+                
+                for i, (label, score) in enumerate(zip(self.score_row_labels, top_scores), 1):
+                    date = datetime.fromisoformat(score['date']).strftime('%Y-%m-%d %H:%M')
+                    score_text = f"{i}. {score['percentage']:.1f}% ({score['score']}/{score['total_questions']}) - {date}"
+                    label.config(text=score_text)
+                    label.pack(pady=5)
+        
+        except FileNotFoundError:
+            self.scores_status_label.config(text="No scores file found")
+            self.scores_status_label.pack(pady=20)
+        
+        self._switch('scores')
 
 
 if __name__ == "__main__":